@@ -10,14 +10,20 @@ Belkorchi LP Editor
 """
 
 import re
+import sys
 import json
 import os
+import stat
+import tempfile
+import itertools
+import hashlib
+import copy
+from dataclasses import dataclass, field
 import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog
-from tkinter.font import Font
+from tkinter import ttk
 import webbrowser
-import threading
-import time
+from functools import lru_cache, partial
+from concurrent.futures import ThreadPoolExecutor
 
 INDEX_FILE = "index.html"
 
@@ -36,12 +42,59 @@ COLORS = {
     "warning": "#faae3d"      
 }
 
+# Style name shared by every section/field label
+_SUBTITLE = sys.intern('Subtitle.TLabel')
+_sublabel = partial(ttk.Label, style=_SUBTITLE)
+
+# ------------- index.html patterns -----------------
+
+RE_LOGO = re.compile(r'(<img\s+class="logo"\s+src=")([^"]+)(")')
+RE_H1 = re.compile(r'(<h1>)([^<]*(?:<(?!/h1>)[^<]*)*)(</h1>)')
+RE_TAGLINE = re.compile(r'(<p\s+class="tagline">)([^<]*(?:<(?!/p>)[^<]*)*)(</p>)')
+RE_TITLE = re.compile(r'(<title>)([^<]*(?:<(?!/title>)[^<]*)*)(</title>)')
+RE_META_DESC = re.compile(r'(<meta\s+name="description"\s+content=")([^"]*)(")')
+RE_META_KEYWORDS = re.compile(r'(<meta\s+name="keywords"\s+content=")([^"]*)(")')
+RE_OG_IMAGE = re.compile(r'(<meta\s+property="og:image"\s+content=")([^"]*)(")')
+RE_TWITTER_IMAGE = re.compile(r'(<meta\s+name="twitter:image"\s+content=")([^"]*)(")')
+# Plain-text fields: (LPData attribute, pattern whose group 2 is the value)
+FIELD_PATTERNS = (
+    ("logo_src", RE_LOGO),
+    ("h1_title", RE_H1),
+    ("tagline", RE_TAGLINE),
+    ("meta_title", RE_TITLE),
+    ("meta_desc", RE_META_DESC),
+    ("meta_keywords", RE_META_KEYWORDS),
+    ("og_image", RE_OG_IMAGE),
+    ("twitter_image", RE_TWITTER_IMAGE),
+)
+# Only written back when non-empty
+OPTIONAL_FIELDS = frozenset(("meta_desc", "meta_keywords", "og_image", "twitter_image"))
+
+# JS declarations; the literal itself is closed with find_block_end
+RE_CPAB_DECL = re.compile(r'\bvar\s+CPABUILDSETTINGS\s*=\s*')
+RE_APPS_DECL = re.compile(r'\bconst\s+APPS\s*=\s*')
+
+RE_CPAB_IT = re.compile(r'"?it"?\s*:\s*([0-9]+)')
+RE_CPAB_KEY = re.compile(r'"?key"?\s*:\s*"([^"]+)"')
+
 # ------------- Animation Helpers -----------------
 
 class HoverButton(ttk.Button):
+    # Named (default_color, hover_color) pairs, filled in by register()
+    VARIANTS = {}
+
+    @classmethod
+    def register(cls, name, default_color, hover_color):
+        cls.VARIANTS[name] = (default_color, hover_color)
+
     def __init__(self, *args, **kwargs):
-        self.hover_color = kwargs.pop('hover_color', COLORS['accent_light'])
-        self.default_color = kwargs.pop('default_color', COLORS['accent'])
+        variant = kwargs.pop('variant', None)
+        if variant is not None:
+            default_color, hover_color = self.VARIANTS[variant]
+        else:
+            default_color, hover_color = COLORS['accent'], COLORS['accent_light']
+        self.hover_color = kwargs.pop('hover_color', hover_color)
+        self.default_color = kwargs.pop('default_color', default_color)
         self.animation_speed = kwargs.pop('animation_speed', 10)
         
         super().__init__(*args, **kwargs)
@@ -73,171 +126,389 @@ class AnimatedLabel(tk.Label):
 
 # ------------- Small helpers -----------------
 
+def _messagebox():
+    """tkinter.messagebox, imported on first use since only dialogs need it"""
+    from tkinter import messagebox
+    return messagebox
+
+def _build_lighten_table(amount):
+    # Integer blend towards white; for amount in [0, 100] it never exceeds 255
+    return bytes((c * (100 - amount) + 255 * amount) // 100 for c in range(256))
+
+# Lighten amounts the UI uses
+LIGHTEN_AMOUNTS = (20,)
+
+# amount -> 256-entry table mapping a channel value to its lightened value;
+# the amounts above are built at import, any other on first use
+_LIGHTEN_TABLES = {a: _build_lighten_table(a) for a in LIGHTEN_AMOUNTS}
+
+def _lighten_table(amount):
+    table = _LIGHTEN_TABLES.get(amount)
+    if table is None:
+        table = _LIGHTEN_TABLES[amount] = _build_lighten_table(amount)
+    return table
+
+@lru_cache(maxsize=None)
+def lighten_color(hex_color, amount):
+    """Lighten a hex color by a percentage amount"""
+    v = int(hex_color.lstrip('#'), 16)
+    table = _lighten_table(amount)
+    return '#%06x' % ((table[(v >> 16) & 0xFF] << 16) | (table[(v >> 8) & 0xFF] << 8) | table[v & 0xFF])
+
+# Button variants used by the dialogs, fixed by the palette
+HoverButton.register('DANGER', COLORS['danger'], lighten_color(COLORS['danger'], 20))
+HoverButton.register('SUCCESS', COLORS['success'], lighten_color(COLORS['success'], 20))
+
+IO_BUFFER_SIZE = 1 << 20
+
+def form_rows(parent, rows, sticky='we', pady=8):
+    """Grid (label, entry factory) rows as label/entry pairs from row 1"""
+    label_kw = dict(column=0, sticky='w', padx=10, pady=pady)
+    entry_kw = dict(column=1, sticky=sticky, padx=10, pady=pady)
+    entries = []
+    for idx, (text, make_entry) in enumerate(rows, start=1):
+        _sublabel(parent, text=text).grid(row=idx, **label_kw)
+        entry = make_entry(parent)
+        entry.grid(row=idx, **entry_kw)
+        entries.append(entry)
+    return entries
+
 def read_file(path):
-    with open(path, "r", encoding="utf-8") as f:
+    with open(path, "r", encoding="utf-8", buffering=IO_BUFFER_SIZE) as f:
         return f.read()
 
 def write_file(path, content):
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(content)
-
-def regex_search(pattern, text, flags=re.DOTALL):
-    m = re.search(pattern, text, flags)
-    return m
-
-def js_apps_to_python(js_array_str):
-    """Convert JS array to Python list[dict]"""
+    """Write content to a sibling temp file and swap it into place"""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", dir=directory)
     try:
-        import json5
-        return json5.loads(js_array_str)
-    except Exception:
-        pass
-
-    s = js_array_str.strip()
-    s = re.sub(r'\btrue\b', 'True', s)
-    s = re.sub(r'\bfalse\b', 'False', s)
-    s = re.sub(r'\bnull\b', 'None', s)
-
-    def quote_keys(match):
-        return f'"{match.group(1)}":'
-
-    s = re.sub(r'(\b[a-zA-Z_][a-zA-Z0-9_]*\b)\s*:', quote_keys, s)
+        with open(fd, "w", encoding="utf-8", buffering=IO_BUFFER_SIZE) as f:
+            f.write(content)
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            # New file: mkstemp forces 0600, so apply the umask as open() would
+            umask = os.umask(0)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def find_block_end(text, start):
+    """Return the index just past the bracket/brace that closes text[start]"""
+    depth = 0
+    quote = None
+    i = start
+    n = len(text)
+    while i < n:
+        ch = text[i]
+        if quote:
+            if ch == "\\":
+                i += 1
+            elif ch == quote:
+                quote = None
+        elif ch in "\"'`":
+            quote = ch
+        elif ch == "/" and text.startswith("//", i):
+            j = text.find("\n", i)
+            i = n if j == -1 else j
+            continue
+        elif ch == "/" and text.startswith("/*", i):
+            j = text.find("*/", i + 2)
+            i = n if j == -1 else j + 2
+            continue
+        elif ch in "[{":
+            depth += 1
+        elif ch in "]}":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    raise ValueError(f"Unterminated block starting at offset {start}.")
+
+def splice(text, spans):
+    """Replace each (start, end, replacement) span of text in a single pass"""
+    parts = []
+    pos = 0
+    for start, end, replacement in sorted(spans):
+        parts.append(text[pos:start])
+        parts.append(replacement)
+        pos = end
+    parts.append(text[pos:])
+    return "".join(parts)
+
+def find_js_literal(text, decl, opener):
+    """Locate the literal opening with `opener` ("[" or "{") assigned by `decl`.
+
+    `decl` matches the declaration up to the literal, e.g. RE_APPS_DECL.
+    Returns (stmt_start, start, end): where the declaration begins, and the
+    span of the literal itself. Returns None when there is no such assignment.
+    """
+    for m in decl.finditer(text):
+        start = m.end()
+        if text.startswith(opener, start):
+            return m.start(), start, find_block_end(text, start)
+    return None
+
+# Shared decoder; strict=False lets string values span lines as JS allows
+JS_DECODER = json.JSONDecoder(strict=False)
+
+def parse_js_array(s):
+    """Parse a JS array literal into Python list[dict] in a single pass.
+
+    The literal is rewritten to JSON as it is scanned (identifier keys get
+    quoted, single-quoted strings become double-quoted, comments and
+    trailing commas are dropped) and then decoded by the C json scanner.
+    """
+    out = []
+    w = out.append
+    i = 0
+    n = len(s)
+    pending_comma = False
+    while i < n:
+        ch = s[i]
+        if ch.isspace():
+            w(ch)
+            i += 1
+            continue
+        if ch == "/" and s.startswith("//", i):
+            j = s.find("\n", i)
+            i = n if j == -1 else j
+            continue
+        if ch == "/" and s.startswith("/*", i):
+            j = s.find("*/", i + 2)
+            i = n if j == -1 else j + 2
+            continue
+        if ch == ",":
+            pending_comma = True
+            i += 1
+            continue
+        if pending_comma:
+            if ch not in "]}":
+                w(",")
+            pending_comma = False
+
+        if ch == '"' or ch == "'":
+            w('"')
+            i += 1
+            while i < n and s[i] != ch:
+                c = s[i]
+                if c == "\\" and i + 1 < n:
+                    nxt = s[i + 1]
+                    w("'" if nxt == "'" else c + nxt)
+                    i += 2
+                    continue
+                w('\\"' if c == '"' else c)
+                i += 1
+            w('"')
+            i += 1
+        elif ch.isalpha() or ch == "_" or ch == "$":
+            j = i + 1
+            while j < n and (s[j].isalnum() or s[j] in "_$"):
+                j += 1
+            word = s[i:j]
+            k = j
+            while k < n and s[k].isspace():
+                k += 1
+            if k < n and s[k] == ":":
+                w(f'"{word}"')
+            else:
+                w(word)
+            i = j
+        else:
+            w(ch)
+            i += 1
 
     try:
-        return eval(s, {"__builtins__": {}})
-    except Exception as e:
-        raise ValueError("Could not parse APPS array. Please install `json5`. Error: " + str(e))
+        # decode() rejects anything after the array, so a bad span fails loudly
+        return JS_DECODER.decode("".join(out))
+    except ValueError as e:
+        raise ValueError("Could not parse APPS array. Error: " + str(e))
+
+# One APPS entry; every app has the same six fields in this order
+APP_TEMPLATE = (
+    '  {{\n'
+    '    name: {n},\n'
+    '    icon: {i},\n'
+    '    locker_id: {l},\n'
+    '    platforms: {p},\n'
+    '    trending: {t},\n'
+    '    featured: {f}\n'
+    '  }},\n'
+)
 
 def python_apps_to_js(apps):
     """Convert Python list[dict] back to JS array"""
-    def py_bool(v):
-        return 'true' if v else 'false'
-
-    def py_list(lst):
-        return "[" + ", ".join(f'"{x}"' for x in lst) + "]"
-
-    lines = ["const APPS = ["]
-    for app in apps:
-        lines.append("  {")
-        lines.append(f'    name: "{app.get("name","")}",')
-        lines.append(f'    icon: "{app.get("icon","")}",')
-        lines.append(f'    locker_id: "{app.get("locker_id","")}",')
-        platforms = app.get("platforms", [])
-        lines.append(f'    platforms: {py_list(platforms)},')
-        trending = py_bool(bool(app.get("trending", False)))
-        featured = py_bool(bool(app.get("featured", False)))
-        lines.append(f'    trending: {trending},')
-        lines.append(f'    featured: {featured}')
-        lines.append("  },")
-    lines.append("];")
-    return "\n".join(lines)
+    def js(value):
+        return json.dumps(value, ensure_ascii=False)
+
+    body = "".join(
+        APP_TEMPLATE.format(
+            n=js(app.get("name", "")),
+            i=js(app.get("icon", "")),
+            l=js(app.get("locker_id", "")),
+            p=js(list(app.get("platforms", []))),
+            t="true" if app.get("trending") else "false",
+            f="true" if app.get("featured") else "false",
+        )
+        for app in apps
+    )
+    return "const APPS = [\n" + body + "];"
 
 # ------------- Parsing / Writing index.html -----------------
 
+FIELDS = (
+    "logo_src", "h1_title", "tagline",
+    "meta_title", "meta_desc", "meta_keywords",
+    "og_image", "twitter_image",
+    "cpab_it", "cpab_key",
+)
+
+@dataclass(slots=True)
+class ParsedIndex:
+    """Fields extracted from one version of index.html"""
+    html: str = ""
+    logo_src: str = ""
+    h1_title: str = ""
+    tagline: str = ""
+    meta_title: str = ""
+    meta_desc: str = ""
+    meta_keywords: str = ""
+    og_image: str = ""
+    twitter_image: str = ""
+    cpab_it: str = ""
+    cpab_key: str = ""
+    apps: list = field(default_factory=list)
+    spans: dict = field(default_factory=dict)
+
+@lru_cache(maxsize=8)
+def _parse_index(path, mtime_ns, size):
+    """Parse index.html; keyed on (path, mtime, size) so edits invalidate it"""
+    html = read_file(path)
+    parsed = ParsedIndex(html=html)
+
+    for name, pat in FIELD_PATTERNS:
+        m = pat.search(html)
+        if m:
+            setattr(parsed, name, m.group(2))
+            parsed.spans[name] = m.span(2)
+
+    span = find_js_literal(html, RE_CPAB_DECL, "{")
+    if span:
+        obj_str = html[span[1]:span[2]]
+        try:
+            obj = json.loads(obj_str)
+            parsed.cpab_it = str(obj.get("it", ""))
+            parsed.cpab_key = str(obj.get("key", ""))
+        except ValueError:
+            # Not strict JSON (e.g. unquoted keys): pick the values out directly
+            it_m = RE_CPAB_IT.search(obj_str)
+            key_m = RE_CPAB_KEY.search(obj_str)
+            if it_m: parsed.cpab_it = it_m.group(1)
+            if key_m: parsed.cpab_key = key_m.group(1)
+
+    span = find_js_literal(html, RE_APPS_DECL, "[")
+    if span:
+        parsed.apps = parse_js_array(html[span[1]:span[2]])
+
+    return parsed
+
+@dataclass(slots=True)
 class LPData:
-    def __init__(self):
-        self.html = ""
-        self.logo_src = ""
-        self.h1_title = ""
-        self.tagline = ""
-        self.meta_title = ""
-        self.meta_desc = ""
-        self.meta_keywords = ""
-        self.og_image = ""
-        self.twitter_image = ""
-        self.cpab_it = ""
-        self.cpab_key = ""
-        self.apps = []
+    html: str = ""
+    logo_src: str = ""
+    h1_title: str = ""
+    tagline: str = ""
+    meta_title: str = ""
+    meta_desc: str = ""
+    meta_keywords: str = ""
+    og_image: str = ""
+    twitter_image: str = ""
+    cpab_it: str = ""
+    cpab_key: str = ""
+    apps: list = field(default_factory=list)
+    # What self.html currently holds for each plain-text field, and where
+    _old_values: dict = field(default_factory=dict, repr=False)
+    _spans: dict = field(default_factory=dict, repr=False)
 
     def load(self, path=INDEX_FILE):
         if not os.path.exists(path):
             raise FileNotFoundError(f"{path} not found in current folder.")
 
-        self.html = read_file(path)
-
-        # Extract all fields
-        m = regex_search(r'<img\s+class="logo"\s+src="([^"]+)"', self.html)
-        if m: self.logo_src = m.group(1)
-
-        m = regex_search(r'<h1>(.*?)</h1>', self.html)
-        if m: self.h1_title = m.group(1)
-        
-        m = regex_search(r'<p class="tagline">(.*?)</p>', self.html)
-        if m: self.tagline = m.group(1)
-
-        m = regex_search(r'<title>(.*?)</title>', self.html)
-        if m: self.meta_title = m.group(1)
-
-        m = regex_search(r'<meta\s+name="description"\s+content="(.*?)"', self.html)
-        if m: self.meta_desc = m.group(1)
+        st = os.stat(path)
+        parsed = _parse_index(os.path.abspath(path), st.st_mtime_ns, st.st_size)
 
-        m = regex_search(r'<meta\s+name="keywords"\s+content="(.*?)"', self.html)
-        if m: self.meta_keywords = m.group(1)
-
-        m = regex_search(r'<meta\s+property="og:image"\s+content="(.*?)"', self.html)
-        if m: self.og_image = m.group(1)
-        
-        m = regex_search(r'<meta\s+name="twitter:image"\s+content="(.*?)"', self.html)
-        if m: self.twitter_image = m.group(1)
-
-        m = regex_search(r'var\s+CPABUILDSETTINGS\s*=\s*({.*?});', self.html)
-        if m:
-            try:
-                obj = json.loads(m.group(1))
-                self.cpab_it = str(obj.get("it", ""))
-                self.cpab_key = str(obj.get("key", ""))
-            except Exception:
-                it_m = re.search(r'"?it"?\s*:\s*([0-9]+)', m.group(1))
-                key_m = re.search(r'"?key"?\s*:\s*"([^"]+)"', m.group(1))
-                if it_m: self.cpab_it = it_m.group(1)
-                if key_m: self.cpab_key = key_m.group(1)
-
-        m = regex_search(r'const\s+APPS\s*=\s*\[(.*?)\];', self.html)
-        if m:
-            apps_array_str = "[" + m.group(1) + "]"
-            self.apps = js_apps_to_python(apps_array_str)
-        else:
-            self.apps = []
+        # The parse result is shared through the cache, so copy it out
+        self.html = parsed.html
+        for name in FIELDS:
+            setattr(self, name, getattr(parsed, name))
+        self.apps = copy.deepcopy(parsed.apps)
+        self._old_values = {name: getattr(parsed, name) for name, _ in FIELD_PATTERNS}
+        self._spans = dict(parsed.spans)
 
     def save(self, path=INDEX_FILE):
         html = self.html
 
-        # Update all fields
-        html = re.sub(r'(<img\s+class="logo"\s+src=")([^"]+)(")', rf'\1{self.logo_src}\3', html)
-        html = re.sub(r'(<h1>)(.*?)(</h1>)', rf'\1{self.h1_title}\3', html, flags=re.DOTALL)
-        html = re.sub(r'(<p\s+class="tagline">)(.*?)(</p>)', rf'\1{self.tagline}\3', html, flags=re.DOTALL)
-        html = re.sub(r'(<title>)(.*?)(</title>)', rf'\1{self.meta_title}\3', html, flags=re.DOTALL)
-
-        if self.meta_desc:
-            html = re.sub(r'(<meta\s+name="description"\s+content=")(.*?)(")', rf'\1{self.meta_desc}\3', html)
-        if self.meta_keywords:
-            html = re.sub(r'(<meta\s+name="keywords"\s+content=")(.*?)(")', rf'\1{self.meta_keywords}\3', html)
-        if self.og_image:
-            html = re.sub(r'(<meta\s+property="og:image"\s+content=")(.*?)(")', rf'\1{self.og_image}\3', html)
-        if self.twitter_image:
-            html = re.sub(r'(<meta\s+name="twitter:image"\s+content=")(.*?)(")', rf'\1{self.twitter_image}\3', html)
-
-        cpab_json = json.dumps({"it": int(self.cpab_it or 0), "key": self.cpab_key or ""})
-        html = re.sub(r'(var\s+CPABUILDSETTINGS\s*=\s*)({.*?})(\s*;)', rf'\1{cpab_json}\3', html, flags=re.DOTALL)
-
-        new_apps_js = python_apps_to_js(self.apps)
-        html = re.sub(r'const\s+APPS\s*=\s*\[(.*?)\];', new_apps_js, html, flags=re.DOTALL)
+        # Collect (start, end, replacement) for every changed field, then
+        # rebuild once. Spans recorded at load time save a regex search.
+        spans = []
+        for name, pat in FIELD_PATTERNS:
+            value = getattr(self, name)
+            if name in OPTIONAL_FIELDS and not value:
+                continue
+            if value == self._old_values.get(name):
+                continue
+            span = self._spans.get(name)
+            if span is None:
+                m = pat.search(html)
+                if not m:
+                    raise ValueError(f"Could not find the {name} field to update.")
+                span = m.span(2)
+            spans.append((span[0], span[1], value))
+
+        # JS literals are located by declaration and replaced verbatim
+        span = find_js_literal(html, RE_CPAB_DECL, "{")
+        if span:
+            cpab_json = json.dumps({"it": int(self.cpab_it or 0), "key": self.cpab_key or ""})
+            spans.append((span[1], span[2], cpab_json))
+
+        span = find_js_literal(html, RE_APPS_DECL, "[")
+        if span:
+            stmt_start, _, end = span
+            if html.startswith(";", end):
+                end += 1
+            spans.append((stmt_start, end, python_apps_to_js(self.apps)))
+        elif self.apps:
+            raise ValueError("Could not find the `const APPS = [...]` block to update.")
+
+        html = splice(html, spans)
 
         write_file(path, html)
         self.html = html
+        # Offsets shifted with the splice; later saves fall back to searching
+        self._old_values = {name: getattr(self, name) for name, _ in FIELD_PATTERNS}
+        self._spans = {}
 
 # ------------- Modern GUI -----------------
 
 class AppGUI(tk.Tk):
-    def __init__(self, lpdata):
+    def __init__(self, lpdata, loading=False):
         super().__init__()
         self.title("Belkorchi LP Editor")
         self.geometry("1200x800")
         self.minsize(1000, 700)
         self.lp = lpdata
+        # True while index.html is still being read; see _on_loaded
+        self._loading = loading
+        # Form entries, kept read-only until the data has loaded
+        self._entries = []
         
-        # Configure theme
-        self.style = ttk.Style()
+        # Configure theme; other windows reuse this Style
+        self.style = ttk.Style(self)
         self.style.theme_use('clam')
         
         # Initialize fonts
@@ -248,10 +519,46 @@ class AppGUI(tk.Tk):
         
         self._configure_styles()
         self.make_widgets()
-        
-        # Animation thread for background effects
-        self.animation_active = True
-        threading.Thread(target=self._animate_background, daemon=True).start()
+        self._pull_vars()
+        self._last_sig = self._compute_sig()
+        self._last_preview_sig = None
+        
+        # Background color cycle, driven by the Tk event loop
+        self._bg_cycle = (COLORS['bg'], "#1e1e3a", "#222242")
+        self._bg_i = 0
+        self._bg_after = None
+        self._tick_bg()
+        # Only cycle while the window is actually shown
+        self.bind("<Unmap>", self._pause_bg, add="+")
+        self.bind("<Map>", self._resume_bg, add="+")
+
+        if loading:
+            self.status_bar.config(text=f"Loading {INDEX_FILE}...")
+
+    def _on_loaded(self, future):
+        """Install the LPData produced by a background load"""
+        try:
+            lp = future.result()
+        except Exception as e:
+            _messagebox().showerror("Error", str(e))
+            self.destroy()
+            return
+        self.lp = lp
+        self._push_vars()
+        self.refresh_tree()
+        self._pull_vars()
+        self._last_sig = self._compute_sig()
+        self._last_preview_sig = None
+        self._loading = False
+        for entry in self._entries:
+            entry.state(['!disabled'])
+        self.status_bar.config(text="Ready")
+
+    def _still_loading(self):
+        """Refuse edits until _on_loaded has installed the real data"""
+        if self._loading:
+            self.status_bar.config(text=f"Still loading {INDEX_FILE}...")
+        return self._loading
 
     def _configure_styles(self):
         """Configure luxury dark theme styles"""
@@ -272,7 +579,7 @@ class AppGUI(tk.Tk):
                            foreground=COLORS['gold'],
                            background=COLORS['bg'])
         
-        self.style.configure('Subtitle.TLabel',
+        self.style.configure(_SUBTITLE,
                            font=self.subtitle_font,
                            foreground=COLORS['text_light'],
                            background=COLORS['bg'])
@@ -367,14 +674,26 @@ class AppGUI(tk.Tk):
                       indicatorbackground=[('active', COLORS['accent_light']),
                                         ('selected', COLORS['gold'])])
 
-    def _animate_background(self):
-        """Background animation thread"""
-        colors = [COLORS['bg'], "#1e1e3a", "#222242"]
-        i = 0
-        while self.animation_active:
-            self.configure(background=colors[i % len(colors)])
-            i += 1
-            time.sleep(3)
+    def _tick_bg(self):
+        """Advance the background color cycle and schedule the next step"""
+        self.configure(background=self._bg_cycle[self._bg_i % len(self._bg_cycle)])
+        self._bg_i += 1
+        self._bg_after = self.after(3000, self._tick_bg)
+
+    def _pause_bg(self, event):
+        if event.widget is self and self._bg_after is not None:
+            self.after_cancel(self._bg_after)
+            self._bg_after = None
+
+    def _resume_bg(self, event):
+        if event.widget is self and self._bg_after is None:
+            self._bg_after = self.after(3000, self._tick_bg)
+
+    def destroy(self):
+        if self._bg_after is not None:
+            self.after_cancel(self._bg_after)
+            self._bg_after = None
+        super().destroy()
 
     def make_widgets(self):
         # Main container
@@ -447,6 +766,17 @@ class AppGUI(tk.Tk):
                                 hover_color=COLORS['accent_light'])
         preview_btn.pack(pady=5, ipadx=20, ipady=5)
 
+    def _form_rows(self, parent, rows, sticky='we', pady=8):
+        """Grid (label, variable, width) rows bound to the settings variables"""
+        entries = form_rows(parent, [
+            (text, partial(ttk.Entry, textvariable=var, width=width))
+            for text, var, width in rows
+        ], sticky=sticky, pady=pady)
+        if self._loading:
+            for entry in entries:
+                entry.state(['disabled'])
+        self._entries.extend(entries)
+
     def init_general_tab(self):
         f = self.tab_general
         
@@ -466,7 +796,7 @@ class AppGUI(tk.Tk):
         scrollbar.pack(side='right', fill='y')
         
         # Section title
-        ttk.Label(scroll_frame, text="General Settings", style='Subtitle.TLabel').grid(row=0, column=0, columnspan=2, pady=(0, 15), sticky='w')
+        _sublabel(scroll_frame, text="General Settings").grid(row=0, column=0, columnspan=2, pady=(0, 15), sticky='w')
         
         # Variables
         self.logo_var = tk.StringVar(value=self.lp.logo_src)
@@ -474,15 +804,11 @@ class AppGUI(tk.Tk):
         self.tagline_var = tk.StringVar(value=self.lp.tagline)
         
         # Form fields with modern styling
-        ttk.Label(scroll_frame, text="Logo URL:", style='Subtitle.TLabel').grid(row=1, column=0, sticky='w', padx=10, pady=8)
-        logo_entry = ttk.Entry(scroll_frame, textvariable=self.logo_var, width=80)
-        logo_entry.grid(row=1, column=1, sticky='we', padx=10, pady=8)
-        
-        ttk.Label(scroll_frame, text="Main Title:", style='Subtitle.TLabel').grid(row=2, column=0, sticky='w', padx=10, pady=8)
-        ttk.Entry(scroll_frame, textvariable=self.h1_var, width=80).grid(row=2, column=1, sticky='we', padx=10, pady=8)
-        
-        ttk.Label(scroll_frame, text="Tagline:", style='Subtitle.TLabel').grid(row=3, column=0, sticky='w', padx=10, pady=8)
-        ttk.Entry(scroll_frame, textvariable=self.tagline_var, width=80).grid(row=3, column=1, sticky='we', padx=10, pady=8)
+        self._form_rows(scroll_frame, [
+            ("Logo URL:", self.logo_var, 80),
+            ("Main Title:", self.h1_var, 80),
+            ("Tagline:", self.tagline_var, 80),
+        ])
         
         scroll_frame.grid_columnconfigure(1, weight=1)
 
@@ -493,7 +819,7 @@ class AppGUI(tk.Tk):
         container.pack(fill='both', expand=True, padx=10, pady=10)
         
         # Section title
-        ttk.Label(container, text="SEO & Social Media", style='Subtitle.TLabel').grid(row=0, column=0, columnspan=2, pady=(0, 15), sticky='w')
+        _sublabel(container, text="SEO & Social Media").grid(row=0, column=0, columnspan=2, pady=(0, 15), sticky='w')
         
         # Variables
         self.meta_title_var = tk.StringVar(value=self.lp.meta_title)
@@ -503,17 +829,13 @@ class AppGUI(tk.Tk):
         self.twitter_image_var = tk.StringVar(value=self.lp.twitter_image)
         
         # Form fields
-        fields = [
-            ("Page Title (<title>)", self.meta_title_var),
-            ("Meta Description", self.meta_desc_var),
-            ("Meta Keywords", self.meta_keywords_var),
-            ("OG Image URL", self.og_image_var),
-            ("Twitter Image URL", self.twitter_image_var)
-        ]
-        
-        for idx, (label, var) in enumerate(fields, start=1):
-            ttk.Label(container, text=label + ":", style='Subtitle.TLabel').grid(row=idx, column=0, sticky='w', padx=10, pady=8)
-            ttk.Entry(container, textvariable=var, width=90).grid(row=idx, column=1, sticky='we', padx=10, pady=8)
+        self._form_rows(container, [
+            ("Page Title (<title>):", self.meta_title_var, 90),
+            ("Meta Description:", self.meta_desc_var, 90),
+            ("Meta Keywords:", self.meta_keywords_var, 90),
+            ("OG Image URL:", self.og_image_var, 90),
+            ("Twitter Image URL:", self.twitter_image_var, 90),
+        ])
         
         container.grid_columnconfigure(1, weight=1)
 
@@ -524,18 +846,17 @@ class AppGUI(tk.Tk):
         container.pack(fill='both', expand=True, padx=10, pady=10)
         
         # Section title
-        ttk.Label(container, text="CPA Build Settings", style='Subtitle.TLabel').grid(row=0, column=0, columnspan=2, pady=(0, 15), sticky='w')
+        _sublabel(container, text="CPA Build Settings").grid(row=0, column=0, columnspan=2, pady=(0, 15), sticky='w')
         
         # Variables
         self.cpab_it_var = tk.StringVar(value=self.lp.cpab_it)
         self.cpab_key_var = tk.StringVar(value=self.lp.cpab_key)
         
         # Form fields
-        ttk.Label(container, text="CPA IT Value:", style='Subtitle.TLabel').grid(row=1, column=0, sticky='w', padx=10, pady=12)
-        ttk.Entry(container, textvariable=self.cpab_it_var, width=30).grid(row=1, column=1, sticky='w', padx=10, pady=12)
-        
-        ttk.Label(container, text="CPA Key:", style='Subtitle.TLabel').grid(row=2, column=0, sticky='w', padx=10, pady=12)
-        ttk.Entry(container, textvariable=self.cpab_key_var, width=60).grid(row=2, column=1, sticky='w', padx=10, pady=12)
+        self._form_rows(container, [
+            ("CPA IT Value:", self.cpab_it_var, 30),
+            ("CPA Key:", self.cpab_key_var, 60),
+        ], sticky='w', pady=12)
         
         container.grid_columnconfigure(1, weight=1)
 
@@ -547,7 +868,7 @@ class AppGUI(tk.Tk):
         container.pack(fill='both', expand=True, padx=10, pady=10)
         
         # Section title
-        ttk.Label(container, text="App Management", style='Subtitle.TLabel').grid(row=0, column=0, columnspan=2, pady=(0, 10), sticky='w')
+        _sublabel(container, text="App Management").grid(row=0, column=0, columnspan=2, pady=(0, 10), sticky='w')
         
         # Treeview with scrollbars
         tree_frame = ttk.Frame(container)
@@ -588,7 +909,7 @@ class AppGUI(tk.Tk):
         for i, (text, cmd, color) in enumerate(actions):
             btn = HoverButton(btn_frame, text=text, command=cmd,
                             default_color=color,
-                            hover_color=self._lighten_color(color, 20))
+                            hover_color=lighten_color(color, 20))
             btn.grid(row=0, column=i, padx=5, sticky='ew')
             btn_frame.grid_columnconfigure(i, weight=1)
         
@@ -598,91 +919,105 @@ class AppGUI(tk.Tk):
         
         self.refresh_tree()
 
-    def _lighten_color(self, hex_color, amount):
-        """Lighten a hex color by a percentage amount"""
-        hex_color = hex_color.lstrip('#')
-        rgb = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-        lighter = tuple(min(255, int(c + (255 - c) * amount / 100)) for c in rgb)
-        return f'#{lighter[0]:02x}{lighter[1]:02x}{lighter[2]:02x}'
+    @staticmethod
+    def _row_values(app):
+        return (
+            app.get("name",""),
+            app.get("icon",""),
+            app.get("locker_id",""),
+            ", ".join(app.get("platforms",[])),
+            "✔️" if app.get("trending", False) else "❌",
+            "✔️" if app.get("featured", False) else "❌",
+        )
+
+    def _insert_row(self, app):
+        iid = f"app{next(self._ids)}"
+        self._app_of[iid] = app
+        self.tree.insert("", "end", iid=iid, values=self._row_values(app))
+        return iid
 
     def refresh_tree(self):
+        """Rebuild every row; only used for the initial load"""
         for i in self.tree.get_children():
             self.tree.delete(i)
-        for idx, app in enumerate(self.lp.apps):
-            self.tree.insert(
-                "",
-                "end",
-                iid=str(idx),
-                values=(
-                    app.get("name",""),
-                    app.get("icon",""),
-                    app.get("locker_id",""),
-                    ", ".join(app.get("platforms",[])),
-                    "✔️" if app.get("trending", False) else "❌",
-                    "✔️" if app.get("featured", False) else "❌",
-                )
-            )
+        # Rows get stable iids; a row's position in the tree always matches
+        # its app's index in self.lp.apps, which stays the source of order.
+        self._ids = itertools.count()
+        self._app_of = {}
+        for app in self.lp.apps:
+            self._insert_row(app)
 
     def add_app(self):
+        if self._still_loading():
+            return
         data = self.prompt_app_data()
         if not data:
             return
         self.lp.apps.append(data)
-        self.refresh_tree()
+        self._insert_row(data)
         self.status_bar.config(text=f"Added app: {data['name']}")
         self.status_bar.flash()
 
     def edit_selected_app(self):
+        if self._still_loading():
+            return
         sel = self.tree.selection()
         if not sel:
-            messagebox.showinfo("Edit", "Select an app first.")
+            _messagebox().showinfo("Edit", "Select an app first.")
             return
-        idx = int(sel[0])
-        old = self.lp.apps[idx]
-        data = self.prompt_app_data(old)
+        iid = sel[0]
+        data = self.prompt_app_data(self._app_of[iid])
         if not data:
             return
-        self.lp.apps[idx] = data
-        self.refresh_tree()
+        self.lp.apps[self.tree.index(iid)] = data
+        self._app_of[iid] = data
+        self.tree.item(iid, values=self._row_values(data))
         self.status_bar.config(text=f"Updated app: {data['name']}")
         self.status_bar.flash()
 
     def delete_selected_app(self):
+        if self._still_loading():
+            return
         sel = self.tree.selection()
         if not sel:
-            messagebox.showinfo("Delete", "Select an app first.")
+            _messagebox().showinfo("Delete", "Select an app first.")
             return
-        idx = int(sel[0])
-        app_name = self.lp.apps[idx].get('name','')
-        if messagebox.askyesno("Delete", f"Delete '{app_name}'?"):
-            self.lp.apps.pop(idx)
-            self.refresh_tree()
+        iid = sel[0]
+        app_name = self._app_of[iid].get('name','')
+        if _messagebox().askyesno("Delete", f"Delete '{app_name}'?"):
+            self.lp.apps.pop(self.tree.index(iid))
+            del self._app_of[iid]
+            self.tree.delete(iid)
             self.status_bar.config(text=f"Deleted app: {app_name}")
             self.status_bar.flash()
 
     def move_up(self):
+        if self._still_loading():
+            return
         sel = self.tree.selection()
         if not sel:
             return
-        idx = int(sel[0])
+        idx = self.tree.index(sel[0])
         if idx <= 0:
             return
         self.lp.apps[idx-1], self.lp.apps[idx] = self.lp.apps[idx], self.lp.apps[idx-1]
-        self.refresh_tree()
-        self.tree.selection_set(str(idx-1))
+        self.tree.move(sel[0], "", idx-1)
+        self.tree.see(sel[0])
         self.status_bar.config(text=f"Moved app up: {self.lp.apps[idx-1].get('name','')}")
         self.status_bar.flash()
 
     def move_down(self):
+        if self._still_loading():
+            return
         sel = self.tree.selection()
         if not sel:
             return
-        idx = int(sel[0])
+        idx = self.tree.index(sel[0])
         if idx >= len(self.lp.apps) - 1:
             return
         self.lp.apps[idx+1], self.lp.apps[idx] = self.lp.apps[idx], self.lp.apps[idx+1]
-        self.refresh_tree()
-        self.tree.selection_set(str(idx+1))
+        self.tree.move(sel[0], "", idx+1)
+        self.tree.see(sel[0])
         self.status_bar.config(text=f"Moved app down: {self.lp.apps[idx+1].get('name','')}")
         self.status_bar.flash()
 
@@ -691,8 +1026,23 @@ class AppGUI(tk.Tk):
         self.wait_window(d)
         return d.result
 
-    def save_changes(self):
-        # Pull back vars
+    def _push_vars(self):
+        """Show the LPData model's values in the form fields"""
+        self.logo_var.set(self.lp.logo_src)
+        self.h1_var.set(self.lp.h1_title)
+        self.tagline_var.set(self.lp.tagline)
+
+        self.meta_title_var.set(self.lp.meta_title)
+        self.meta_desc_var.set(self.lp.meta_desc)
+        self.meta_keywords_var.set(self.lp.meta_keywords)
+        self.og_image_var.set(self.lp.og_image)
+        self.twitter_image_var.set(self.lp.twitter_image)
+
+        self.cpab_it_var.set(self.lp.cpab_it)
+        self.cpab_key_var.set(self.lp.cpab_key)
+
+    def _pull_vars(self):
+        """Copy the form fields back into the LPData model"""
         self.lp.logo_src = self.logo_var.get().strip()
         self.lp.h1_title = self.h1_var.get().strip()
         self.lp.tagline = self.tagline_var.get().strip()
@@ -706,28 +1056,62 @@ class AppGUI(tk.Tk):
         self.lp.cpab_it = self.cpab_it_var.get().strip() or "0"
         self.lp.cpab_key = self.cpab_key_var.get().strip()
 
+    def _compute_sig(self):
+        """Digest of everything save() writes, used to detect unsaved edits"""
+        lp = self.lp
+        state = (
+            lp.logo_src, lp.h1_title, lp.tagline,
+            lp.meta_title, lp.meta_desc, lp.meta_keywords,
+            lp.og_image, lp.twitter_image,
+            lp.cpab_it, lp.cpab_key,
+            tuple(
+                (a.get("name",""), a.get("icon",""), a.get("locker_id",""),
+                 tuple(a.get("platforms",[])),
+                 bool(a.get("trending", False)), bool(a.get("featured", False)))
+                for a in lp.apps
+            ),
+        )
+        return hashlib.blake2b(repr(state).encode("utf-8"), digest_size=16).digest()
+
+    def save_changes(self):
+        if self._still_loading():
+            return
+        self._pull_vars()
+        sig = self._compute_sig()
+        if sig == self._last_sig:
+            self.status_bar.config(text="No changes to save", fg=COLORS['text_light'])
+            self.status_bar.flash()
+            return
+
         try:
             self.lp.save(INDEX_FILE)
-            messagebox.showinfo("Saved", "index.html updated successfully!")
+            self._last_sig = sig
+            _messagebox().showinfo("Saved", "index.html updated successfully!")
             self.status_bar.config(text="Changes saved successfully", fg=COLORS['success'])
             self.status_bar.flash()
         except Exception as e:
-            messagebox.showerror("Error", f"Could not save: {e}")
+            _messagebox().showerror("Error", f"Could not save: {e}")
             self.status_bar.config(text=f"Error saving: {str(e)}", fg=COLORS['danger'])
             self.status_bar.flash()
 
     def preview_changes(self):
+        if self._still_loading():
+            return
         try:
-            # Save to a temp file
+            # Save to a temp file, unless it already holds the current state
             temp_file = "preview.html"
-            self.lp.save(temp_file)
+            self._pull_vars()
+            sig = self._compute_sig()
+            if sig != self._last_preview_sig or not os.path.exists(temp_file):
+                self.lp.save(temp_file)
+                self._last_preview_sig = sig
             
-            # Open in default browser
-            webbrowser.open(f"file://{os.path.abspath(temp_file)}")
+            # Open in default browser, reusing an existing window if possible
+            webbrowser.open(f"file://{os.path.abspath(temp_file)}", new=0)
             self.status_bar.config(text="Preview opened in browser", fg=COLORS['success'])
             self.status_bar.flash()
         except Exception as e:
-            messagebox.showerror("Preview Error", f"Could not open preview: {e}")
+            _messagebox().showerror("Preview Error", f"Could not open preview: {e}")
             self.status_bar.config(text=f"Preview error: {str(e)}", fg=COLORS['danger'])
             self.status_bar.flash()
 
@@ -741,13 +1125,53 @@ class AppGUI(tk.Tk):
 
 Use the 'Preview' button to see changes in your browser before saving.
 """
-        messagebox.showinfo("Help", help_text)
-
-    def __del__(self):
-        self.animation_active = False
+        _messagebox().showinfo("Help", help_text)
 
 # --------- App Dialog ----------
 
+# ttk styles are shared by every window, so the dialog's styles are applied
+# once at startup rather than on each open.
+_STYLES_DONE = False
+
+_DIALOG_STYLES = (
+    ('.', dict(background=COLORS['bg'], foreground=COLORS['text'])),
+    ('TLabel', dict(background=COLORS['bg'], foreground=COLORS['text'])),
+    ('TEntry', dict(fieldbackground=COLORS['card'], foreground=COLORS['text_light'])),
+    ('TButton', dict(background=COLORS['accent'], foreground=COLORS['text_light'])),
+    ('TCheckbutton', dict(background=COLORS['bg'], foreground=COLORS['text'])),
+)
+# _DIALOG_STYLES rendered once as `ttk::style configure` commands
+_DIALOG_STYLE_TCL = "\n".join(
+    f"ttk::style configure {name} " + " ".join(f"-{k} {{{v}}}" for k, v in opts.items())
+    for name, opts in _DIALOG_STYLES
+)
+
+# Platform ids never contain whitespace; one translate drops it all
+_PLATS_CLEAN = str.maketrans('', '', ' \t\r\n')
+# Platforms field value for a new app
+_DEFAULT_PLATS_STR = "android,ios"
+# Sanity limit on the raw platforms field, checked before it is parsed
+MAX_PLATFORMS_LEN = 1024
+
+def _ensure_styles_configured(root):
+    global _STYLES_DONE
+    if _STYLES_DONE:
+        return
+    # Reuse the root's Style wrapper rather than building another one
+    style = getattr(root, 'style', None) or ttk.Style(root)
+    if style.theme_use() != 'clam':
+        style.theme_use('clam')
+
+    # All option sets go to Tcl as one pre-generated script
+    style.tk.eval(_DIALOG_STYLE_TCL)
+
+    button_states = [('active', COLORS['accent_light']), ('pressed', COLORS['accent'])]
+    current = {tuple(str(x) for x in spec) for spec in style.map('TButton', 'background')}
+    if not set(button_states) <= current:
+        style.map('TButton', background=button_states)
+
+    _STYLES_DONE = True
+
 class AppDialog(tk.Toplevel):
     def __init__(self, master, initial=None):
         super().__init__(master)
@@ -755,27 +1179,32 @@ class AppDialog(tk.Toplevel):
         self.result = None
         self.initial = initial or {}
         
-        # Set theme
-        self.style = ttk.Style(self)
-        self.style.theme_use('clam')
-        self.style.configure('.', background=COLORS['bg'], foreground=COLORS['text'])
-        self.style.configure('TLabel', background=COLORS['bg'], foreground=COLORS['text'])
-        self.style.configure('TEntry', fieldbackground=COLORS['card'], foreground=COLORS['text_light'])
-        self.style.configure('TButton', background=COLORS['accent'], foreground=COLORS['text_light'])
-        self.style.map('TButton', background=[('active', COLORS['accent_light']), ('pressed', COLORS['accent'])])
-        self.style.configure('TCheckbutton', background=COLORS['bg'], foreground=COLORS['text'])
-        
-        self.name_var = tk.StringVar(value=self.initial.get("name",""))
-        self.icon_var = tk.StringVar(value=self.initial.get("icon",""))
-        self.locker_var = tk.StringVar(value=self.initial.get("locker_id",""))
-        self.platforms_var = tk.StringVar(value=",".join(self.initial.get("platforms",["android","ios"])))
+        # Text fields are read once in ok(), so the entries hold them directly;
+        # the checkbuttons still need variables for their toggle state.
         self.trending_var = tk.BooleanVar(value=bool(self.initial.get("trending", False)))
         self.featured_var = tk.BooleanVar(value=bool(self.initial.get("featured", False)))
 
         self.make_widgets()
+        # Window-manager hints must be set before the window is first mapped
         self.transient(master)
-        self.grab_set()
         self.resizable(False, False)
+        # The grab needs a viewable window, so take it once Tk is idle
+        self._finalize_after = self.after_idle(self._finalize_modal)
+
+    def _finalize_modal(self):
+        self._finalize_after = None
+        try:
+            self.wait_visibility()
+        except tk.TclError:
+            # Closed before it became visible
+            return
+        self.grab_set()
+
+    def destroy(self):
+        if self._finalize_after is not None:
+            self.after_cancel(self._finalize_after)
+            self._finalize_after = None
+        super().destroy()
 
     def make_widgets(self):
         # Main container
@@ -783,26 +1212,23 @@ class AppDialog(tk.Toplevel):
         container.pack(fill="both", expand=True, padx=15, pady=15)
         
         # Title
-        ttk.Label(container, text="App Details", style='Subtitle.TLabel').grid(row=0, column=0, columnspan=2, pady=(0, 15))
-        
-        row = 1
-        ttk.Label(container, text="Name:", style='Subtitle.TLabel').grid(row=row, column=0, sticky="w", padx=10, pady=8)
-        name_entry = ttk.Entry(container, textvariable=self.name_var, width=50)
-        name_entry.grid(row=row, column=1, sticky="w", padx=10, pady=8)
-        row += 1
-
-        ttk.Label(container, text="Icon URL:", style='Subtitle.TLabel').grid(row=row, column=0, sticky="w", padx=10, pady=8)
-        icon_entry = ttk.Entry(container, textvariable=self.icon_var, width=50)
-        icon_entry.grid(row=row, column=1, sticky="w", padx=10, pady=8)
-        row += 1
-
-        ttk.Label(container, text="Locker ID:", style='Subtitle.TLabel').grid(row=row, column=0, sticky="w", padx=10, pady=8)
-        ttk.Entry(container, textvariable=self.locker_var, width=50).grid(row=row, column=1, sticky="w", padx=10, pady=8)
-        row += 1
-
-        ttk.Label(container, text="Platforms (comma separated):", style='Subtitle.TLabel').grid(row=row, column=0, sticky="w", padx=10, pady=8)
-        ttk.Entry(container, textvariable=self.platforms_var, width=50).grid(row=row, column=1, sticky="w", padx=10, pady=8)
-        row += 1
+        _sublabel(container, text="App Details").grid(row=0, column=0, columnspan=2, pady=(0, 15))
+        
+        initial = self.initial
+        plats = ",".join(initial["platforms"]) if "platforms" in initial else _DEFAULT_PLATS_STR
+        rows = (
+            ("Name:", initial.get("name","")),
+            ("Icon URL:", initial.get("icon","")),
+            ("Locker ID:", initial.get("locker_id","")),
+            ("Platforms (comma separated):", plats),
+        )
+        entries = form_rows(container, [
+            (text, partial(ttk.Entry, width=50)) for text, _ in rows
+        ], sticky='w')
+        for entry, (_, value) in zip(entries, rows):
+            entry.insert(0, value)
+        self._name_entry, self._icon_entry, self._locker_entry, self._platforms_entry = entries
+        row = len(rows) + 1
 
         # Checkboxes in a frame
         check_frame = ttk.Frame(container)
@@ -819,35 +1245,31 @@ class AppDialog(tk.Toplevel):
         btn_frame.grid(row=row, column=0, columnspan=2, pady=15)
         
         cancel_btn = HoverButton(btn_frame, text="Cancel", command=self.destroy,
-                               default_color=COLORS['danger'],
-                               hover_color=self._lighten_color(COLORS['danger'], 20))
+                               variant='DANGER')
         cancel_btn.pack(side="left", padx=15)
         
         save_btn = HoverButton(btn_frame, text="Save", command=self.ok,
-                             default_color=COLORS['success'],
-                             hover_color=self._lighten_color(COLORS['success'], 20))
+                             variant='SUCCESS')
         save_btn.pack(side="left", padx=15)
 
-    def _lighten_color(self, hex_color, amount):
-        """Lighten a hex color by a percentage amount"""
-        hex_color = hex_color.lstrip('#')
-        rgb = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-        lighter = tuple(min(255, int(c + (255 - c) * amount / 100)) for c in rgb)
-        return f'#{lighter[0]:02x}{lighter[1]:02x}{lighter[2]:02x}'
-
     def ok(self):
-        name = self.name_var.get().strip()
+        name = self._name_entry.get().strip()
         if not name:
-            messagebox.showerror("Error", "Name is required.")
+            _messagebox().showerror("Error", "Name is required.")
+            return
+        raw = self._platforms_entry.get()
+        if len(raw) > MAX_PLATFORMS_LEN:
+            _messagebox().showerror("Error", "Platforms list is too long.")
             return
-        icon = self.icon_var.get().strip()
-        locker = self.locker_var.get().strip()
-        plats = [p.strip().lower() for p in self.platforms_var.get().split(",") if p.strip()]
+
+        # All checks passed; only now normalise the fields
+        raw = raw.lower().translate(_PLATS_CLEAN)
+        plats = [p for p in raw.split(",") if p]
 
         self.result = {
             "name": name,
-            "icon": icon,
-            "locker_id": locker,
+            "icon": self._icon_entry.get().strip(),
+            "locker_id": self._locker_entry.get().strip(),
             "platforms": plats,
             "trending": self.trending_var.get(),
             "featured": self.featured_var.get()
@@ -856,19 +1278,27 @@ class AppDialog(tk.Toplevel):
 
 # ------------- main -----------------
 
-def main():
-    try:
-        lp = LPData()
-        lp.load(INDEX_FILE)
-    except Exception as e:
-        messagebox.showerror("Error", str(e))
-        return
+def load_index(path=INDEX_FILE):
+    lp = LPData()
+    lp.load(path)
+    return lp
 
-    app = AppGUI(lp)
-    try:
+def main():
+    # Read index.html on a worker thread so the window can paint meanwhile;
+    # the result is handed to the GUI on the Tk thread.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        future = pool.submit(load_index, INDEX_FILE)
+        app = AppGUI(LPData(), loading=True)
+        _ensure_styles_configured(app)
+
+        def poll():
+            if future.done():
+                app._on_loaded(future)
+            else:
+                app.after(30, poll)
+
+        app.after(30, poll)
         app.mainloop()
-    finally:
-        app.animation_active = False
 
 if __name__ == "__main__":
     main()
\ No newline at end of file